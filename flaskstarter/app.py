@@ -1,15 +1,62 @@
 # -*- coding: utf-8 -*-
 
+from decimal import Decimal
+
+import orjson
 from flask import Flask
+from flask.json.provider import JSONProvider
+
+from .extensions import db
 
 
 # For import *
 __all__ = ["create_app"]
 
 
+def _orjson_default(obj):
+    # orjson has no Decimal support (prices are DecimalField)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    # Same key handling as Flask's default provider: sorted, non-str allowed
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+    def dumps(self, obj, **kwargs):
+        option = self.option
+        if not kwargs.pop("sort_keys", True):
+            option &= ~orjson.OPT_SORT_KEYS
+        indent = kwargs.pop("indent", None)
+        if indent not in (None, 2):
+            raise TypeError("orjson only supports indent=2")
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if kwargs:
+            raise TypeError(f"Unsupported dumps arguments: {', '.join(kwargs)}")
+        return orjson.dumps(obj, default=_orjson_default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            raise TypeError(f"Unsupported loads arguments: {', '.join(kwargs)}")
+        return orjson.loads(s)
+
+
 def create_app(config=None):
     # Create a Flask app
 
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+
+    # Check a pooled connection out per request and hand it back afterwards
+    @app.before_request
+    def _db_connect():
+        db.connect(reuse_if_open=True)
+
+    @app.teardown_request
+    def _db_close(exc):
+        if not db.is_closed():
+            db.close()
 
     return app
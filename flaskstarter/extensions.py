@@ -1,5 +1,13 @@
 # -*- coding: utf-8 -*-
-from peewee import SqliteDatabase
+from playhouse.pool import PooledSqliteDatabase
 from .config import DefaultConfig
 
-db = SqliteDatabase(DefaultConfig.DATABASE_URI)
+# Pooled connections move between Flask's worker threads, hence
+# check_same_thread=False; timeout makes requests wait for a free connection
+db = PooledSqliteDatabase(
+    DefaultConfig.DATABASE_URI,
+    max_connections=16,
+    stale_timeout=300,
+    timeout=10,
+    check_same_thread=False,
+)
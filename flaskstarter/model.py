@@ -48,12 +48,10 @@ class ProductOrderQuantity(Model):
 
 class CreditCardDetails(Model):
     name = CharField()
-    number = DecimalField(max_digits=16, decimal_places=0)
-    expiration_year = DecimalField(max_digits=4, decimal_places=0)
-    cvv = DecimalField(max_digits=3, decimal_places=0)
-    expiration_month = DecimalField(
-        max_digits=2,
-        decimal_places=0,
+    number = CharField(max_length=19)
+    expiration_year = IntegerField()
+    cvv = CharField(max_length=4)
+    expiration_month = IntegerField(
         constraints=[Check("expiration_month < 13"), Check("expiration_month > 0")],
     )
     class Meta:
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from flaskstarter import create_app
+from flaskstarter.extensions import db
+
+
+@pytest.fixture
+def app(tmp_path):
+    # Point the shared database at a throwaway file for each test
+    db.init(str(tmp_path / "test.db"))
+    app = create_app()
+    app.config.update(TESTING=True)
+    yield app
+    db.close_all()
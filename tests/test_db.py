@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+from threading import Thread
+
+from flaskstarter.extensions import db
+from flaskstarter.model import Product
+
+
+def test_pooled_connection_is_usable_from_another_thread(app, client):
+    with db:
+        db.create_tables([Product])
+    app.add_url_rule("/count", "count", lambda: {"count": Product.select().count()})
+
+    responses = [client.get("/count")]
+    worker = Thread(target=lambda: responses.append(app.test_client().get("/count")))
+    worker.start()
+    worker.join()
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert [r.get_json() for r in responses] == [{"count": 0}] * 2
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+from decimal import Decimal
+
+import pytest
+from flask import jsonify
+
+
+def test_decimal_is_serialized_as_string(app, client):
+    app.add_url_rule("/price", "price", lambda: jsonify(price=Decimal("12.50")))
+
+    response = client.get("/price")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"price": "12.50"}
+
+
+def test_int_keys_are_serialized(app, client):
+    app.add_url_rule("/ints", "ints", lambda: jsonify({1: "x", 2: "y"}))
+
+    response = client.get("/ints")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"1": "x", "2": "y"}
+
+
+def test_keys_are_sorted(app):
+    assert app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+
+def test_indent(app):
+    assert app.json.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_unsupported_arguments_are_rejected(app):
+    with pytest.raises(TypeError):
+        app.json.dumps({"a": 1}, indent=4)
+    with pytest.raises(TypeError):
+        app.json.dumps({"a": 1}, ensure_ascii=False)
+    with pytest.raises(TypeError):
+        app.json.loads('{"a": 1}', object_hook=dict)
+
+
+def test_unserializable_type_names_the_type(app):
+    with pytest.raises(TypeError) as excinfo:
+        app.json.dumps({"a": object()})
+
+    # orjson raises its own error and chains the one from the default hook
+    assert str(excinfo.value.__cause__) == (
+        "Object of type object is not JSON serializable"
+    )
+
+
+def test_integers_are_limited_to_64_bits(app):
+    assert app.json.dumps(2**63 - 1) == str(2**63 - 1)
+    with pytest.raises(TypeError, match="64-bit"):
+        app.json.dumps(2**64)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+from flaskstarter.extensions import db
+from flaskstarter.model import CreditCardDetails
+
+
+def test_credit_card_round_trip(app):
+    with db:
+        db.create_tables([CreditCardDetails])
+        card = CreditCardDetails.create(
+            name="John Doe",
+            number="0234567890123456",
+            expiration_year=2030,
+            cvv="012",
+            expiration_month=9,
+        )
+
+        card = CreditCardDetails.get_by_id(card.id)
+
+    assert card.number == "0234567890123456"
+    assert card.cvv == "012"
+    assert type(card.expiration_year) is int and card.expiration_year == 2030
+    assert type(card.expiration_month) is int and card.expiration_month == 9